@@ -1,323 +1,555 @@
-# Solving Bloxorz using A* Search
-
-# This is imported for priority queue implementation
-import heapq
-
-
-"""
-Node class, for each node N, "costGuess" variable is basically g(N) + h(N)
-where g(N) is the cost for coming to the node through "path" and h(N) is
-the cost to go from N to goal node guessed by a heuristic function.
-Path keeps the list of actions that are used to come to the "state" of node
-from the initial state
-"""
-class Node:
-
-    def __init__(self, costGuess, state, path):
-        self.costGuess = costGuess
-        self.state = state
-        self.path = path
-
-    '''
-    __lt__ is used to inform the priority queue about how to compare nodes
-    We say that node whose "costGuess" is smaller
-    should become first in the priority queue
-    '''
-    def __lt__(self, other):
-        return self.costGuess < other.costGuess
-
-
-"""
-State class, each state object keeps necessary information that represents a state.
-Here "x_cor" is x coordinate of the top-leftmost part of the block, "y_cor" is
-y coordinate of the top-leftmost part of the block, "orient" is 0 if the block stands vertically
-1 if the block is standing horizontally and parallel to x-axis, 2 if the block is standing
-horizontally and parallel to y-axis. This information is enough for representing
-a state, under the assumption that positions of empty tiles and safe tiles will never change
-and any empty or safe tile will not be removed or added during the game. 
-"""
-class State:
-
-    """
-    ySize and xSize are variables that are shared among all State objects, 
-    they keep the size of input matrix, their values will be used in state hashing 
-    function, and those values will be determined by Bloxorz class before solving 
-    the problem.
-    """
-    ySize = 0
-    xSize = 0
-
-    def __init__(self, x_cor, y_cor, orient):
-        self.x_cor = x_cor
-        self.y_cor = y_cor
-        self.orient = orient
-    
-    '''
-    Hash function is used because we will keep states expanded, 
-    and we need to have a way to easily detect if a state is already in the set.
-    It is guaranteed that with this hashing function, same states will have 
-    same hash values and different states will have different hash values.
-    '''
-    def __hash__(self):
-        return (State.ySize * State.xSize * self.orient) + (State.xSize * self.y_cor) + self.x_cor
-
-    def __eq__(self,other):
-        return self.__hash__() == other.__hash__()
-
-
-class PriorityQueue:
-    
-    def __init__(self):
-        self.data = []
-        self.counter = 0
-    
-    def push(self, item):
-        heapq.heappush(self.data, item)
-        self.counter += 1
-    
-    def pop(self):
-        self.counter -= 1
-        return heapq.heappop(self.data)
-    
-    def not_empty(self):
-        return self.counter > 0
-
-
-class Bloxorz:
-
-    """
-    This class is responsible from solving the problem, its constructor takes
-    input matrix as parameter
-    """
-
-    def __init__(self, input_matrix):
-
-        '''
-        Map data will be kept here
-        '''
-        self.map = input_matrix
-        
-        '''
-        Expanded states will be kept here so that we will not expand them again and
-        we will not add them to queue again
-        '''
-        self.closed = set()
-
-        '''
-        States to be expanded will be kept here
-        '''
-        self.queue = PriorityQueue()
-        
-        '''
-        Inform State class about the size of input matrix so that 
-        State class will be able to use its hashing function
-        '''
-        State.xSize = len(self.map[0])
-        State.ySize = len(self.map)
-
-        '''
-        Find goal position and keep this information, 
-        because it will be used by goal test function
-        '''
-        for i in range(0,len(self.map)):
-            res = self.map[i].find("G")
-            if res != -1:
-                self.goalX = res
-                self.goalY = i
-                break
-
-        '''
-        Find initial position and orientation of the block, create initial state and node according 
-        to this information and put this node into queue. 
-        Also in map, replace "S" with "O" because it is a safe tile
-        '''
-        for i in range(0,len(self.map)):
-            res = self.map[i].find("S")
-            if res != -1:
-                orient = 0
-                if res + 1 < len(self.map[i]) and self.map[i][res + 1] == 'S':
-                    orient = 1
-                    self.map[i] = self.map[i].replace("SS", "00")
-                elif i + 1 < len(self.map) and self.map[i + 1][res] == 'S':
-                    orient = 2
-                    self.map[i] = self.map[i].replace("S", "0")
-                    self.map[i + 1] = self.map[i + 1].replace("S", "0")
-                else:
-                    self.map[i] = self.map[i].replace("S", "0")
-                self.initial = State(res, i, orient)
-                self.queue.push(Node(self.heuristic(self.initial), self.initial, []))
-                break
-
-    def is_goal(self, state):
-        return state.orient == 0 and state.x_cor == self.goalX and state.y_cor == self.goalY
-
-    '''
-    Guess the cost from "state" to goal state. 
-    This heuristic function is admissible and monotonic
-    '''
-    def heuristic(self, state):
-        return (abs(self.goalX - state.x_cor) / 3) + (abs(self.goalY - state.y_cor) / 3)
-
-    # Check whether a tile is a safe tile or empty tile
-    def is_safe(self, x, y):
-        return (len(self.map) > y >= 0) and \
-                (len(self.map[y]) > x >= 0) and \
-               (self.map[y][x] == 'O' or self.map[y][x] == 'G')
-
-    '''
-    Display the board that is represented by "state", in other words, 
-    merge the board information from "self.map" and block information 
-    from "state" and display it to user
-    '''
-    def print_state(self, state):
-
-        print_state = []
-        for y in range(0, state.ySize):
-            print_state.append([])
-            for x in range(0, state.xSize):
-                print_state[y].append(self.map[y][x])
-
-        if not self.is_goal(state):
-            print_state[state.y_cor][state.x_cor] = "S"
-
-            if state.orient == 1:
-                print_state[state.y_cor][state.x_cor + 1] = "S"
-
-            if state.orient == 2:
-                print_state[state.y_cor + 1][state.x_cor] = "S"
-
-        for y in range(0, len(print_state)):
-            print("".join(print_state[y]))
-
-    '''
-    Prints the shortest sequence of legal states and taken actions 
-    that are used to navigate the block from its given initial 
-    location into the goal
-    '''
-    def print_result(self, result):
-        st = 1
-        current_state = self.initial
-            
-        for action in result:
-            print("State : ", st)
-            self.print_state(current_state)
-            print("Action : ", action)
-            print(" ")
-            st += 1
-            current_state = self.successors(current_state)[action]
-
-        print("State : ", st)
-        self.print_state(current_state)
-        if len(result) == 0:
-            print("There is no solution for this problem!")
-        else:
-            print("This optimal solution requires", len(result), "moves.")
-
-    '''
-    Returns a hashtable where the values are possible states that can be reached from "state" and
-    keys of values are the action that is required to go to this state
-    '''
-    def successors(self, state):
-        result = {}
-        
-        if state.orient == 0:
-            # Up
-            if self.is_safe(state.x_cor, state.y_cor-2) and self.is_safe(state.x_cor, state.y_cor-1):
-                result['U'] = State(state.x_cor, state.y_cor-2, 2)
-            # Down
-            if self.is_safe(state.x_cor, state.y_cor+1) and self.is_safe(state.x_cor, state.y_cor+2):
-                result['D'] = State(state.x_cor, state.y_cor+1, 2)
-            # Left
-            if self.is_safe(state.x_cor-2, state.y_cor) and self.is_safe(state.x_cor-1, state.y_cor):
-                result['L'] = State(state.x_cor-2, state.y_cor, 1)
-            # Right
-            if self.is_safe(state.x_cor+1, state.y_cor) and self.is_safe(state.x_cor+2, state.y_cor):
-                result['R'] = State(state.x_cor+1, state.y_cor, 1)
-                
-        elif state.orient == 1:
-            # Up
-            if self.is_safe(state.x_cor, state.y_cor-1) and self.is_safe(state.x_cor+1, state.y_cor-1):
-                result['U'] = (State(state.x_cor, state.y_cor-1, 1))
-            # Down
-            if self.is_safe(state.x_cor, state.y_cor+1) and self.is_safe(state.x_cor+1, state.y_cor+1):
-                result['D'] = (State(state.x_cor, state.y_cor+1, 1))
-            # Left
-            if self.is_safe(state.x_cor-1, state.y_cor):
-                result['L'] = (State(state.x_cor-1, state.y_cor, 0))
-            # Right
-            if self.is_safe(state.x_cor+2, state.y_cor):
-                result['R'] = (State(state.x_cor+2, state.y_cor, 0))
-                
-        else:
-            # Up
-            if self.is_safe(state.x_cor, state.y_cor-1):
-                result['U'] = State(state.x_cor, state.y_cor-1, 0)
-            # Down
-            if self.is_safe(state.x_cor, state.y_cor+2):
-                result['D'] = State(state.x_cor, state.y_cor+2, 0)
-            # Left
-            if self.is_safe(state.x_cor-1, state.y_cor) and self.is_safe(state.x_cor-1, state.y_cor+1):
-                result['L'] = State(state.x_cor-1, state.y_cor, 2)
-            # Right
-            if self.is_safe(state.x_cor+1, state.y_cor) and self.is_safe(state.x_cor+1, state.y_cor+1):
-                result['R'] = State(state.x_cor+1, state.y_cor, 2)
-                
-        return result
-
-    '''
-    Finds the optimal solution and returns the action list that leads to solution
-    from initial state
-    '''
-    def solve(self):
-        while self.queue.not_empty():
-            # get the node from queue whose guessedCost is the smallest
-            current = self.queue.pop()
-
-            '''
-            if this state is expanded before, then do not take this into consideration
-            because it cannot lead to an optimal solution as the heuristic function is monotonic
-            (because it is sure that when a state is expanded, then the optimal path to this state is found)
-            '''
-            if current.state not in self.closed:
-                # if the state is goal state, then return the path to this state...
-                if self.is_goal(current.state):
-                    return current.path
-                # ...otherwise, find all successors of this state
-                successors = self.successors(current.state)
-                for key in successors:
-                    new_state = successors[key]
-
-                    '''
-                    if the successor is not expanded before, add this to queue
-                    (if there is same state in queue, we will expand the node with lower cost guess
-                    and we will not take the other into consideration)
-                    '''
-                    if new_state not in self.closed:
-
-                        '''
-                        deep copy the path of parent state to a list and append the action, use
-                        it in the creation of the new node
-                        '''
-                        templist = []
-                        for element in current.path:
-                            templist.append(element)
-                        templist.append(key)
-                        # costGuess is the current path length + cost guess for going from new state to goal state
-                        self.queue.push(Node(len(templist) + self.heuristic(new_state), new_state, templist))
-                # add expanded state to set
-                self.closed.add(current.state)
-        # if there is no solution, return an empty list
-        return []
-                
-
-file = open('gameboard.txt', 'r')
-inputData = []
-while True:
-    line = file.readline()
-    if line == '':
-        break
-    inputData.append(line.strip())
-file.close()
-problem = Bloxorz(inputData)
-solution = problem.solve()
-problem.print_result(solution)
+# Solving Bloxorz using A* Search
+
+# This is imported for priority queue implementation
+import heapq
+# These are imported for the precomputed heuristic table
+from array import array
+from collections import deque
+
+
+"""
+Move table, one entry per orientation. Each move is a tuple
+(action, cx1, cy1, cx2, cy2, ndx, ndy, new_orient): the block may take
+"action" if the two tiles at offsets (cx1, cy1) and (cx2, cy2) from its
+top-leftmost part are safe, and it then ends up displaced by (ndx, ndy)
+with orientation "new_orient". Moves that only need one tile checked
+simply list the same offset twice. This replaces the three if/elif
+blocks that successors used to contain with a single data-driven loop.
+"""
+MOVES = (
+    # orient == 0, the block stands vertically
+    (('U', 0, -2, 0, -1, 0, -2, 2),
+     ('D', 0, 1, 0, 2, 0, 1, 2),
+     ('L', -2, 0, -1, 0, -2, 0, 1),
+     ('R', 1, 0, 2, 0, 1, 0, 1)),
+    # orient == 1, the block lies parallel to x-axis
+    (('U', 0, -1, 1, -1, 0, -1, 1),
+     ('D', 0, 1, 1, 1, 0, 1, 1),
+     ('L', -1, 0, -1, 0, -1, 0, 0),
+     ('R', 2, 0, 2, 0, 2, 0, 0)),
+    # orient == 2, the block lies parallel to y-axis
+    (('U', 0, -1, 0, -1, 0, -1, 0),
+     ('D', 0, 2, 0, 2, 0, 2, 0),
+     ('L', -1, 0, -1, 1, -1, 0, 2),
+     ('R', 1, 0, 1, 1, 1, 0, 2)),
+)
+
+"""
+The move that undoes each move; rolling the block up and then down (or left
+and then right) always restores the previous state, whatever the orientation.
+Used by the bidirectional search to turn backward moves into forward actions.
+"""
+REVERSE = {'U': 'D', 'D': 'U', 'L': 'R', 'R': 'L'}
+
+
+class Bloxorz:
+
+    """
+    This class is responsible from solving the problem, its constructor takes
+    input matrix as parameter.
+
+    A state is represented by a single bit-packed integer instead of an object:
+
+        state = (orient << (shiftX + shiftY)) | (y_cor << shiftX) | x_cor
+
+    where shiftX and shiftY are the number of bits needed for an x and y
+    coordinate, "x_cor" is x coordinate of the top-leftmost part of the block, "y_cor"
+    is y coordinate of the top-leftmost part of the block, "orient" is 0 if the
+    block stands vertically, 1 if the block lies horizontally and parallel to
+    x-axis, 2 if the block lies horizontally and parallel to y-axis. This
+    information is enough for representing a state, under the assumption that
+    positions of empty tiles and safe tiles will never change and any empty or
+    safe tile will not be removed or added during the game. Working with plain
+    integers keeps the hot loop free of object allocation, attribute access
+    and hashing through dunder methods.
+    """
+
+    def __init__(self, input_matrix):
+
+        '''
+        Map data will be kept here, used only for displaying boards to the user
+        '''
+        self.map = input_matrix
+
+        '''
+        Size of the playing field used by the state encoding and the safety
+        bitmap. The real board is surrounded by a frame of two unsafe tiles on
+        every side (a move displaces the block by at most two tiles), so all
+        coordinates below are shifted by +2 and safety checks never need to
+        test the board boundaries
+        '''
+        self.xSize = len(self.map[0]) + 4
+        self.ySize = len(self.map) + 4
+        self.area = self.xSize * self.ySize
+
+        '''
+        Widths of the coordinate fields inside a packed state integer and the
+        total number of representable states. Packing with shifts and masks
+        instead of multiplications makes encoding and decoding a couple of
+        bit operations and gives a dense id space, so every per-state table
+        below can be a flat array indexed by the state itself
+        '''
+        self.shiftX = (self.xSize - 1).bit_length()
+        self.shiftY = (self.ySize - 1).bit_length()
+        self.maskX = (1 << self.shiftX) - 1
+        self.maskY = (1 << self.shiftY) - 1
+        self.stateCount = 3 << (self.shiftX + self.shiftY)
+
+        '''
+        Best known path cost for every state, a flat array indexed by the
+        packed state where unvisited states hold a huge value. A successor is
+        only pushed if it improves on the cost recorded here, so the queue
+        does not fill up with dominated duplicates, and a popped node whose
+        depth is worse than the recorded cost is a stale entry and is skipped.
+        Being an array lookup, the check involves no hashing at all.
+        This subsumes the old closed set because the heuristic is monotonic
+        '''
+        self.best_g = array('i', [1 << 30] * self.stateCount)
+
+        '''
+        Search nodes to be expanded will be kept here, used as a binary heap
+        directly through the heapq module functions. A node is the plain tuple
+        (costGuess, -depth, tie, state, index) where "costGuess" is depth plus
+        the heuristic, the negated depth breaks costGuess ties in favour of
+        the node that is deeper (closer to the goal), which crosses heuristic
+        plateaus with fewer expansions, "tie" is a monotonically increasing
+        counter that makes every tuple unique (so the heap compares ints in C
+        and never reaches the later fields), and "index" points into
+        self.parents. parents keeps
+        one (parent_index, action, state) triple per pushed node, from which
+        the action and state sequences are rebuilt once the goal is found;
+        the root has parent -1
+        '''
+        self.queue = []
+        self.parents = []
+        self.counter = 0
+
+        '''
+        Memoized successor tuples, a flat table indexed by the packed state;
+        None marks states whose moves have not been computed yet
+        '''
+        self.succ_cache = [None] * self.stateCount
+
+        '''
+        A single pass over the map builds the flat safety bitmap and at the
+        same time locates the goal tile and the block. safe[y * xSize + x] is
+        1 iff the (shifted) tile at (x, y) can carry the block, which holds
+        for safe tiles, the goal tile and the tiles the block starts on; the
+        two-tile zero frame around the board makes out-of-board moves read a
+        0 without any bounds check. When the block starts lying down it
+        covers two "S" tiles and the first one found (topmost, then leftmost)
+        is its top-leftmost part, so the orientation follows from where the
+        second "S" is
+        '''
+        startX = -1
+        startY = -1
+        self.safe = bytearray(self.area)
+        for i in range(0, len(self.map)):
+            row = self.map[i]
+            for j in range(0, len(row)):
+                ch = row[j]
+                if ch == 'O' or ch == 'G' or ch == 'S':
+                    self.safe[(i + 2) * self.xSize + (j + 2)] = 1
+                    if ch == 'G':
+                        self.goalX = j + 2
+                        self.goalY = i + 2
+                    elif ch == 'S' and startX == -1:
+                        startX = j
+                        startY = i
+
+        '''
+        Create the initial state from the block position, and replace "S" with
+        "0" in the display map so that printed boards keep showing the tiles
+        the block started on the same way as before
+        '''
+        orient = 0
+        if startX + 1 < len(self.map[startY]) and self.map[startY][startX + 1] == 'S':
+            orient = 1
+        elif startY + 1 < len(self.map) and self.map[startY + 1][startX] == 'S':
+            orient = 2
+        self.initial = self.encode(startX + 2, startY + 2, orient)
+        self.map = [row.replace("S", "0") for row in self.map]
+
+        '''
+        Precompute the heuristic for every possible state: h_table[state] is
+        the exact number of moves between "state" and the goal state on the
+        relaxed board, which is admissible and monotonic (see
+        relaxed_distances) and the strongest bound obtainable without looking
+        at the unsafe tiles
+        '''
+        self.h_table = self.relaxed_distances(self.encode(self.goalX, self.goalY, 0))
+
+        self.best_g[self.initial] = 0
+        self.parents.append((-1, None, self.initial))
+        heapq.heappush(self.queue, (self.heuristic(self.initial), 0, self.counter, self.initial, 0))
+        self.counter += 1
+
+    # Pack block position and orientation into a single integer state
+    def encode(self, x, y, orient):
+        return (orient << (self.shiftX + self.shiftY)) | (y << self.shiftX) | x
+
+    # Unpack an integer state back into (x, y, orient)
+    def decode(self, state):
+        return state & self.maskX, (state >> self.shiftX) & self.maskY, state >> (self.shiftX + self.shiftY)
+
+    '''
+    Returns a table with the exact number of moves between "origin" and every
+    state on the board whose safety bitmap is "tiles". When "tiles" is None a
+    relaxed board where every tile inside the board rectangle is safe is used;
+    any real path is also a path on the relaxed board, so those distances are
+    admissible heuristics (and monotonic, being exact distances of a
+    relaxation). Passing self.safe instead gives true distances on the real
+    board, which is useful as an O(states) reachability check. The table is
+    filled by a single breadth-first search from "origin"; every move has an
+    inverse move, so distances from the origin equal distances to the origin.
+    Unreachable states keep a huge value and are never preferred
+    '''
+    def relaxed_distances(self, origin, tiles=None):
+        big = 1 << 30
+        table = array('i', [big] * self.stateCount)
+        if tiles is None:
+            tiles = bytearray(self.area)
+            for y in range(2, self.ySize - 2):
+                for x in range(2, self.xSize - 2):
+                    tiles[y * self.xSize + x] = 1
+        table[origin] = 0
+        frontier = deque([origin])
+        while frontier:
+            state = frontier.popleft()
+            x, y, orient = self.decode(state)
+            base = y * self.xSize + x
+            dist = table[state] + 1
+            for action, cx1, cy1, cx2, cy2, ndx, ndy, new_orient in MOVES[orient]:
+                if tiles[base + cy1 * self.xSize + cx1] and tiles[base + cy2 * self.xSize + cx2]:
+                    new_state = self.encode(x + ndx, y + ndy, new_orient)
+                    if table[new_state] > dist:
+                        table[new_state] = dist
+                        frontier.append(new_state)
+        return table
+
+    def is_goal(self, state):
+        return state == self.encode(self.goalX, self.goalY, 0)
+
+    '''
+    Guess the cost from "state" to goal state: a single lookup into the table
+    of exact relaxed-board distances precomputed in the constructor. This is
+    admissible and monotonic, and it already covers everything the old
+    arithmetic formula captured (tile distance and orientation) exactly
+    '''
+    def heuristic(self, state):
+        return self.h_table[state]
+
+    # Check whether a tile is a safe tile, a single byte load thanks to the
+    # zero frame around the bitmap
+    def is_safe(self, x, y):
+        return self.safe[y * self.xSize + x]
+
+    '''
+    Display the board that is represented by "state", in other words,
+    merge the board information from "self.map" and block information
+    from "state" and display it to user
+    '''
+    def print_state(self, state):
+
+        x_cor, y_cor, orient = self.decode(state)
+        # shift back from bitmap coordinates to raw map coordinates
+        x_cor -= 2
+        y_cor -= 2
+
+        print_state = []
+        for y in range(0, len(self.map)):
+            print_state.append([])
+            for x in range(0, len(self.map[y])):
+                print_state[y].append(self.map[y][x])
+
+        if not self.is_goal(state):
+            print_state[y_cor][x_cor] = "S"
+
+            if orient == 1:
+                print_state[y_cor][x_cor + 1] = "S"
+
+            if orient == 2:
+                print_state[y_cor + 1][x_cor] = "S"
+
+        for y in range(0, len(print_state)):
+            print("".join(print_state[y]))
+
+    '''
+    Prints the shortest sequence of legal states and taken actions
+    that are used to navigate the block from its given initial
+    location into the goal. The solver already knows the state sequence,
+    so it is passed in directly instead of being recomputed move by move
+    through successors; "states" holds one more entry than "result"
+    because it starts with the initial state and ends with the goal state
+    '''
+    def print_result(self, result, states):
+
+        for st in range(1, len(result) + 1):
+            print("State : ", st)
+            self.print_state(states[st - 1])
+            print("Action : ", result[st - 1])
+            print(" ")
+
+        print("State : ", len(result) + 1)
+        self.print_state(states[-1])
+        if len(result) == 0:
+            print("There is no solution for this problem!")
+        else:
+            print("This optimal solution requires", len(result), "moves.")
+
+    '''
+    Returns a tuple of (action, state) pairs, one per state that can be
+    reached from "state" with the action that reaches it. The result is
+    memoized in succ_cache: a state is typically examined several times
+    during a search (as the neighbour of different parents, or by both
+    directions of the bidirectional search), and the move checks only have
+    to run on the first visit
+    '''
+    def successors(self, state):
+        cached = self.succ_cache[state]
+        if cached is not None:
+            return cached
+
+        x_cor, y_cor, orient = self.decode(state)
+        safe = self.safe
+        width = self.xSize
+        base = y_cor * width + x_cor
+
+        result = []
+        for action, cx1, cy1, cx2, cy2, ndx, ndy, new_orient in MOVES[orient]:
+            if safe[base + cy1 * width + cx1] and safe[base + cy2 * width + cx2]:
+                result.append((action, self.encode(x_cor + ndx, y_cor + ndy, new_orient)))
+
+        result = tuple(result)
+        self.succ_cache[state] = result
+        return result
+
+    '''
+    Finds the optimal solution and returns the action list that leads to solution
+    from initial state, together with the list of states it passes through
+    '''
+    def solve(self):
+        while self.queue:
+            # get the node from queue whose guessedCost is the smallest
+            costGuess, neg_depth, tie, state, index = heapq.heappop(self.queue)
+            depth = -neg_depth
+
+            '''
+            if a cheaper path to this state was recorded after this node was
+            pushed, the node is stale and cannot lead to an optimal solution,
+            so do not take it into consideration
+            '''
+            if depth <= self.best_g[state]:
+                # if the state is goal state, then return the path to this state...
+                if self.is_goal(state):
+                    '''
+                    rebuild the action and state sequences by walking the parent
+                    indices back to the initial node, then reverse them so that
+                    the lists start from the initial state
+                    '''
+                    path = []
+                    states = []
+                    while index != -1:
+                        index, action, node_state = self.parents[index]
+                        states.append(node_state)
+                        if action is not None:
+                            path.append(action)
+                    path.reverse()
+                    states.reverse()
+                    return path, states
+                # ...otherwise, find all successors of this state
+                depth += 1
+                for key, new_state in self.successors(state):
+
+                    '''
+                    only add the successor to queue if this path to it is strictly
+                    better than every path to it that was seen before
+                    '''
+                    if depth < self.best_g[new_state]:
+                        self.best_g[new_state] = depth
+                        self.parents.append((index, key, new_state))
+                        # costGuess is the current path length + cost guess for going from new state to goal state
+                        heapq.heappush(self.queue, (depth + self.heuristic(new_state), -depth, self.counter, new_state, len(self.parents) - 1))
+                        self.counter += 1
+        # if there is no solution, return an empty action list and the initial state
+        return [], [self.initial]
+
+    '''
+    Finds the optimal solution with iterative deepening A* instead of the
+    priority queue based search above, and returns the same (actions, states)
+    pair as solve. IDA* repeatedly runs a depth-first search that prunes any
+    node whose costGuess exceeds the current bound, then raises the bound to
+    the smallest costGuess that was pruned. Memory use is one byte per state
+    for the on-path bitmap plus the current path, with no heap, no best_g
+    table and no parents list. The heuristic is admissible, so the first
+    solution found within a bound is optimal. Unsolvable boards are detected
+    before any deepening by a single breadth-first pass over the real board:
+    iterative deepening alone would only raise the bound pass by pass while
+    each pass enumerates ever longer simple paths, which does not finish in
+    any practical time on open boards. The stateCount cap on the bound stays
+    as a backstop (an optimal solution visits every state at most once, so
+    its cost is below stateCount)
+    '''
+    def ida_star(self):
+        goal = self.encode(self.goalX, self.goalY, 0)
+        if self.relaxed_distances(goal, self.safe)[self.initial] >= 1 << 30:
+            # if there is no solution, return an empty action list and the initial state
+            return [], [self.initial]
+        bound = self.heuristic(self.initial)
+        path = []
+        states = [self.initial]
+        on_path = bytearray(self.stateCount)
+        on_path[self.initial] = 1
+        while bound < self.stateCount:
+            bound = self.ida_search(self.initial, 0, bound, path, states, on_path)
+            if bound == -1:
+                return path, states
+        # if there is no solution, return an empty action list and the initial state
+        return [], [self.initial]
+
+    '''
+    One depth-first pass of IDA*: returns -1 if the goal was reached (with the
+    actions and states taken so far accumulated in "path" and "states"), or
+    otherwise the smallest costGuess that exceeded "bound", to be used as the
+    next bound. States already on the current path are never entered again:
+    an optimal path has no repeated states, so this keeps optimality, while
+    cutting every rolling loop the block could otherwise cycle through
+    forever and capping the recursion depth at the number of distinct states
+    '''
+    def ida_search(self, state, depth, bound, path, states, on_path):
+        costGuess = depth + self.heuristic(state)
+        if costGuess > bound:
+            return costGuess
+        if self.is_goal(state):
+            return -1
+        minimum = 1 << 30
+        for action, new_state in self.successors(state):
+            if on_path[new_state]:
+                continue
+            path.append(action)
+            states.append(new_state)
+            on_path[new_state] = 1
+            result = self.ida_search(new_state, depth + 1, bound, path, states, on_path)
+            if result == -1:
+                return -1
+            path.pop()
+            states.pop()
+            on_path[new_state] = 0
+            if result < minimum:
+                minimum = result
+        return minimum
+
+    '''
+    Finds the optimal solution with bidirectional A*: one search runs forward
+    from the initial state and one backward from the goal state, and they meet
+    in the middle, which typically expands far fewer nodes than a single
+    search for deep solutions. Every move has an inverse move and a move is
+    legal exactly when the tiles under the resulting block are safe, so the
+    predecessors of a state are obtained by applying the ordinary successors
+    to it and flipping the action labels. The backward search is guided by
+    relaxed distances to the initial state, mirroring how the forward search
+    uses relaxed distances to the goal. "mu" tracks the cost of the best
+    initial-to-goal path discovered where the frontiers touch; once the
+    smaller of the two top costGuess values reaches mu, no better path can
+    exist and the search stops. Returns the same (actions, states) pair as
+    solve
+    '''
+    def solve_bidirectional(self):
+        big = 1 << 30
+        goal = self.encode(self.goalX, self.goalY, 0)
+        if self.initial == goal:
+            return [], [self.initial]
+
+        '''
+        One entry per direction (0 is forward, 1 is backward): the heuristic
+        table, the heap, the best known path cost per state, the parents list
+        for path reconstruction and the parents index of the best entry per
+        state. Parent entries store the action of the forward move along the
+        edge, so reconstruction never has to flip actions again
+        '''
+        h = (self.h_table, self.relaxed_distances(self.initial))
+        queues = ([], [])
+        g = (array('i', [big] * self.stateCount), array('i', [big] * self.stateCount))
+        parents = ([], [])
+        entries = ({}, {})
+        counter = 0
+        for side, origin in ((0, self.initial), (1, goal)):
+            g[side][origin] = 0
+            parents[side].append((-1, None, origin))
+            entries[side][origin] = 0
+            heapq.heappush(queues[side], (h[side][origin], 0, counter, origin, 0))
+            counter += 1
+
+        mu = big
+        meet = -1
+        while queues[0] and queues[1]:
+            # always advance the direction whose cheapest node is cheaper
+            side = 0 if queues[0][0][0] <= queues[1][0][0] else 1
+            costGuess, neg_depth, tie, state, index = heapq.heappop(queues[side])
+            depth = -neg_depth
+
+            '''
+            the popped costGuess is the smaller of the two tops, so once it
+            reaches mu neither frontier can still contain a cheaper path
+            '''
+            if costGuess >= mu:
+                break
+            # skip stale entries, like solve does
+            if depth > g[side][state]:
+                continue
+
+            depth += 1
+            other = 1 - side
+            for action, new_state in self.successors(state):
+                if depth < g[side][new_state]:
+                    g[side][new_state] = depth
+                    edge_action = action if side == 0 else REVERSE[action]
+                    parents[side].append((index, edge_action, new_state))
+                    entries[side][new_state] = len(parents[side]) - 1
+                    if h[side][new_state] < big:
+                        heapq.heappush(queues[side], (depth + h[side][new_state], -depth, counter, new_state, len(parents[side]) - 1))
+                        counter += 1
+                    # the frontiers touch at new_state, remember the best such path
+                    if g[other][new_state] < big and depth + g[other][new_state] < mu:
+                        mu = depth + g[other][new_state]
+                        meet = new_state
+
+        if meet == -1:
+            # if there is no solution, return an empty action list and the initial state
+            return [], [self.initial]
+
+        '''
+        Splice the two parent chains at the meeting state. The forward chain is
+        walked back to the initial state and reversed; the backward chain is
+        already ordered from the meeting state towards the goal, with each
+        entry naming the forward action that leaves its state
+        '''
+        path = []
+        states = []
+        index = entries[0][meet]
+        while index != -1:
+            index, action, node_state = parents[0][index]
+            states.append(node_state)
+            if action is not None:
+                path.append(action)
+        path.reverse()
+        states.reverse()
+        index, action, node_state = parents[1][entries[1][meet]]
+        while action is not None:
+            path.append(action)
+            index, action, node_state = parents[1][index]
+            states.append(node_state)
+        return path, states
+
+
+file = open('gameboard.txt', 'r')
+inputData = []
+while True:
+    line = file.readline()
+    if line == '':
+        break
+    inputData.append(line.strip())
+file.close()
+problem = Bloxorz(inputData)
+solution, states = problem.solve()
+problem.print_result(solution, states)